@@ -1,2 +0,0 @@
-# gpt_sql_assistant/__init__.py
-# This file is empty, it just makes this directory a Python package.
\ No newline at end of file
@@ -1,8 +1,24 @@
 import sqlite3
-import pandas as pd
+import asyncio
+import atexit
+import contextlib
+import csv
+import itertools
+import hashlib
+import json
 import os
-import openai
-from openai import OpenAI
+import re
+import shutil
+import subprocess
+import sys
+from collections import OrderedDict
+from datetime import datetime
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+try:
+    import readline  # Line editing and history for the SQL shell where available
+except ImportError:
+    readline = None
 
 def load_openai_key(filepath="key.txt"):
     """Load OpenAI API key from a file in the current working directory."""
@@ -14,44 +30,302 @@ def load_openai_key(filepath="key.txt"):
         print(f"Could not find {filepath}. Please create the file with your OpenAI API key.")
         return None
 
-# Create the OpenAI client using the loaded key
-api_key = load_openai_key()
-if not api_key:
-    exit(1)
+# OpenAI client and the event loop that drives it, created on first use so the
+# load and sql commands never pay for them or need an API key. One loop serves
+# the whole session so the client's connection pool is reused
+_client = None
+_loop = None
+
+def get_openai_client():
+    """Return the shared OpenAI client, or None if no API key is available."""
+    global _client, _loop
+    if _client is None:
+        api_key = load_openai_key()
+        if not api_key:
+            return None
+        from openai import AsyncOpenAI
+        # Retries are handled by _call_openai, so the SDK's own retry loop is disabled
+        _client = AsyncOpenAI(api_key=api_key, max_retries=0)
+        _loop = asyncio.new_event_loop()
+        atexit.register(close_openai_client)
+    return _client
+
+def close_openai_client():
+    """Close the OpenAI client and its event loop if they were created."""
+    global _client, _loop
+    if _client is not None:
+        _loop.run_until_complete(_client.close())
+        _loop.close()
+        _client = _loop = None
+
+# Numeric literals SQLite's column affinity converts on insert. int() and
+# float() are looser (1_000, nan, inf, non-ASCII digits) and would let text
+# through as numbers
+INTEGER_PATTERN = re.compile(r"\s*[+-]?[0-9]+\s*")
+REAL_PATTERN = re.compile(r"\s*[+-]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][+-]?[0-9]+)?\s*")
+
+def _parse_integer(value):
+    if not INTEGER_PATTERN.fullmatch(value):
+        raise ValueError(f"Not an integer: {value!r}")
+    return int(value)
+
+def _parse_real(value):
+    if not REAL_PATTERN.fullmatch(value):
+        raise ValueError(f"Not a real: {value!r}")
+    return float(value)
+
+# Candidate column types tried in order while sniffing CSV values
+SNIFF_TYPES = (
+    ("INTEGER", _parse_integer),
+    ("REAL", _parse_real),
+    ("TIMESTAMP", datetime.fromisoformat),
+)
+SNIFF_TYPE_NAMES = {idx: name for idx, (name, _) in enumerate(SNIFF_TYPES)}
+
+# Arrow types PyArrow parses sniffed columns into; anything else stays text
+ARROW_TYPES = {"INTEGER": "int64", "REAL": "float64"}
+ARROW_BLOCK_SIZE = 1 << 24
+
+# (schema_version, schema text) for the chat prompt, rebuilt only after the
+# database schema changes
+_schema_cache = None
 
-client = OpenAI(api_key=api_key)
+# Generated SQL keyed by (user request, schema digest), oldest evicted first
+SQL_CACHE_SIZE = 256
+_sql_cache = OrderedDict()
+
+# Most questions folded into a single OpenAI request
+MAX_BATCH_QUESTIONS = 5
+
+# Chat model used for SQL generation and its completion budget per question
+OPENAI_MODEL = "gpt-4o-mini"
+MAX_TOKENS_PER_QUERY = 256
+
+# Append-only error log handle, shared by every log_error call
+_log_file = None
+
+# Where the SQL shell keeps its command history between sessions
+HISTORY_FILE = os.path.expanduser("~/.gpt_sql_history")
+HISTORY_LENGTH = 1000
+
+# Rows fetched from SQLite per batch when printing query results
+FETCH_BATCH_SIZE = 1000
+
+# Connection settings tuned for insert-heavy sessions (256MB page cache)
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-262144",
+)
 
 def connect_db(db_name=":memory:"):
     """Connect to SQLite database (default: in-memory)."""
-    return sqlite3.connect(db_name)
+    conn = sqlite3.connect(db_name)
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(f"PRAGMA {pragma}")
+    return conn
 
 def table_exists(conn, table_name):
     cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name=?;", (table_name,))
     return cursor.fetchone() is not None
 
 def get_table_schema(conn, table_name):
-    cursor = conn.execute(f"PRAGMA table_info('{table_name}')")
-    return [(row[1], row[2]) for row in cursor.fetchall()]  # [(name, type), ...]
-
-def infer_sql_type(dtype):
-    if pd.api.types.is_integer_dtype(dtype):
-        return "INTEGER"
-    elif pd.api.types.is_float_dtype(dtype):
-        return "REAL"
-    elif pd.api.types.is_bool_dtype(dtype):
-        return "BOOLEAN"
-    elif pd.api.types.is_datetime64_any_dtype(dtype):
-        return "TIMESTAMP"
-    else:
-        return "TEXT"
+    cursor = conn.execute("SELECT name, type FROM pragma_table_info(?) ORDER BY cid;", (table_name,))
+    return cursor.fetchall()  # [(name, type), ...]
+
+def read_csv_header(reader):
+    """Read the header row from a csv.reader, naming blank columns and renaming
+    repeated ones the way pandas does (`Unnamed: 0`; `a`, `a.1`, `a.2`, ...)."""
+    header = next(filter(None, reader), None)
+    if header is None:
+        raise ValueError("CSV has no header row")
+
+    columns = []
+    for i, col in enumerate(header):
+        # e.g. the unnamed index column written by DataFrame.to_csv()
+        if not col:
+            col = f"Unnamed: {i}"
+        name, n = col, 0
+        while name in columns:
+            n += 1
+            name = f"{col}.{n}"
+        columns.append(name)
+    return columns
+
+def sniff_schema(csv_file, sample=1000):
+    """Infer ([(name, type), ...], primary_key) for a CSV from its header and first `sample` rows.
+
+    An `id` column is proposed as the primary key when every sampled value is a
+    distinct integer; otherwise primary_key is None.
+    """
+    with open(csv_file, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = read_csv_header(reader)
+        # Index into SNIFF_TYPES per column; None until a non-empty value is seen
+        candidates = [None] * len(header)
+        id_index = next((i for i, col in enumerate(header) if col.lower() == "id"), None)
+        seen_ids = set()
+        # Blank lines come through as [] and are not counted as sampled rows
+        for row in itertools.islice(filter(None, reader), sample):
+            for i, value in enumerate(row[:len(header)]):
+                idx = candidates[i] or 0
+                # Empty values say nothing, and TEXT columns cannot narrow again
+                if value == "" or idx == len(SNIFF_TYPES):
+                    continue
+                while idx < len(SNIFF_TYPES):
+                    try:
+                        SNIFF_TYPES[idx][1](value)
+                        break
+                    except ValueError:
+                        idx += 1
+                candidates[i] = idx
+
+            if id_index is not None:
+                try:
+                    row_id = _parse_integer(row[id_index])
+                except (IndexError, ValueError):
+                    row_id = None
+                if row_id is None or row_id in seen_ids:
+                    id_index = None
+                else:
+                    seen_ids.add(row_id)
+
+    schema = [(col, SNIFF_TYPE_NAMES.get(idx, "TEXT")) for col, idx in zip(header, candidates)]
+    primary_key = None
+    if id_index is not None and schema[id_index][1] == "INTEGER":
+        primary_key = header[id_index]
+    return schema, primary_key
+
+def iter_csv_rows(reader, column_count, key_index=None):
+    """Yield CSV rows one at a time with empty and missing fields mapped to NULL.
+
+    Raises sqlite3.IntegrityError if the column at key_index is empty, since
+    SQLite would silently assign a new rowid to a NULL INTEGER PRIMARY KEY.
+    """
+    for row in reader:
+        # Blank lines carry no data, as with pandas and PyArrow
+        if not row:
+            continue
+        if len(row) < column_count:
+            row = row + [""] * (column_count - len(row))
+        if key_index is not None and row[key_index] == "":
+            raise sqlite3.IntegrityError(f"Empty value in primary key column on line {reader.line_num}")
+        # Most rows have no empty fields and can be passed through untouched
+        if "" in row:
+            row = [value if value != "" else None for value in row]
+        yield row
+
+def iter_arrow_rows(csv_file, schema, key_index=None):
+    """Yield CSV rows parsed in parallel blocks by PyArrow, typed per the sniffed schema.
+
+    Raises sqlite3.IntegrityError if the column at key_index has a null, as
+    iter_csv_rows does.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+
+    # Use the csv module's view of the header so Arrow sees the same column names
+    with open(csv_file, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        read_csv_header(reader)
+        header_lines = reader.line_num
+
+    column_types = {col: pa.type_for_alias(ARROW_TYPES.get(sql_type, "string")) for col, sql_type in schema}
+    reader = pacsv.open_csv(
+        csv_file,
+        read_options=pacsv.ReadOptions(
+            column_names=[col for col, _ in schema],
+            skip_rows=header_lines,
+            block_size=ARROW_BLOCK_SIZE,
+            use_threads=True,
+        ),
+        convert_options=pacsv.ConvertOptions(
+            column_types=column_types,
+            null_values=[""],
+            strings_can_be_null=True,
+        ),
+    )
+    real_indexes = [i for i, (_, sql_type) in enumerate(schema) if sql_type == "REAL"]
+    for batch in reader:
+        if key_index is not None and batch.column(key_index).null_count:
+            raise sqlite3.IntegrityError("Empty value in primary key column")
+        # Arrow reads nan/inf as floats where SQLite keeps the text; hand such
+        # files to the csv module so both paths store the same values
+        for i in real_indexes:
+            if pc.any(pc.invert(pc.is_finite(batch.column(i)))).as_py():
+                raise pa.ArrowInvalid(f"Non-finite value in column {schema[i][0]!r}")
+        yield from zip(*(column.to_pylist() for column in batch.columns))
+
+def quote_identifier(name):
+    """Quote a table or column name for SQL text, where it cannot be bound as a parameter."""
+    if not name or "\x00" in name:
+        raise ValueError(f"Invalid identifier: {name!r}")
+    return '"' + name.replace('"', '""') + '"'
+
+def create_table(conn, table_name, schema, primary_key=None, replace=False):
+    """Create a table for the schema; an INTEGER primary key aliases the rowid.
+
+    With replace=True any existing table of that name is dropped first, in the
+    same transaction as the CREATE.
+    """
+    table = quote_identifier(table_name)
+    column_defs = [
+        f"{quote_identifier(col)} {sql_type}" + (" PRIMARY KEY" if col == primary_key else "")
+        for col, sql_type in schema
+    ]
+    drop_stmt = f"DROP TABLE IF EXISTS {table};" if replace else ""
+    conn.executescript(
+        f"BEGIN; {drop_stmt} CREATE TABLE IF NOT EXISTS {table} ({', '.join(column_defs)}); COMMIT;"
+    )
+
+def insert_csv_rows(conn, csv_file, table_name, schema, primary_key=None):
+    """Insert every data row of a CSV into a table in a single transaction.
+
+    Rows with an empty primary_key value raise sqlite3.IntegrityError.
+    """
+    key_index = next((i for i, (col, _) in enumerate(schema) if col == primary_key), None)
+    placeholders = ", ".join("?" * len(schema))
+    insert_stmt = f"INSERT INTO {quote_identifier(table_name)} VALUES ({placeholders})"
+
+    # PyArrow parses in parallel blocks where it is installed; it is imported
+    # here so that sessions which never load a CSV don't pay for it
+    try:
+        import pyarrow as pa
+    except ImportError:
+        pa = None
+
+    if pa is not None:
+        try:
+            conn.execute("BEGIN")
+            conn.executemany(insert_stmt, iter_arrow_rows(csv_file, schema, key_index))
+            conn.commit()
+            return
+        except pa.ArrowInvalid:
+            # A value past the sniffed sample did not fit its column type, or
+            # a row is short; start over with the csv module below, which
+            # fills missing fields with NULL. This is a normal outcome, not
+            # an error, so nothing is logged
+            conn.rollback()
+
+    # Stream rows straight from the CSV reader into one transaction;
+    # SQLite's column affinity converts the numeric strings on insert
+    with open(csv_file, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        read_csv_header(reader)  # Skip header
+        conn.execute("BEGIN")
+        conn.executemany(insert_stmt, iter_csv_rows(reader, len(schema), key_index))
+        conn.commit()
 
 def load_csv_to_table(conn, csv_file, table_name):
     """Load CSV into SQLite table with schema conflict handling."""
     try:
-        df = pd.read_csv(csv_file)
-        inferred_schema = [(col, infer_sql_type(df[col].dtype)) for col in df.columns]
+        inferred_schema, primary_key = sniff_schema(csv_file)
 
-        if table_exists(conn, table_name):
+        exists = table_exists(conn, table_name)
+        replace = False
+        if exists:
             existing_schema = get_table_schema(conn, table_name)
 
             # Compare schemas
@@ -61,7 +335,7 @@ def load_csv_to_table(conn, csv_file, table_name):
                 action = input("Choose an action: ").strip().lower()
 
                 if action == "o":
-                    conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+                    replace = True
                 elif action == "r":
                     new_table_name = input("Enter new table name: ").strip()
                     return load_csv_to_table(conn, csv_file, new_table_name)
@@ -72,20 +346,81 @@ def load_csv_to_table(conn, csv_file, table_name):
                     print("Invalid action. Skipping.")
                     return
 
-        column_defs = [f'"{col}" {sql_type}' for col, sql_type in inferred_schema]
-        create_stmt = f'CREATE TABLE IF NOT EXISTS "{table_name}" ({", ".join(column_defs)});'
-        conn.execute(create_stmt)
-        conn.commit()
-
-        df.to_sql(table_name, conn, if_exists='append', index=False)
+        created = replace or not exists
+        create_table(conn, table_name, inferred_schema, primary_key, replace=replace)
+        if not created:
+            # Appending: guard whichever column aliases the existing table's rowid
+            row = conn.execute(
+                "SELECT name FROM pragma_table_info(?) WHERE pk = 1 AND upper(type) = 'INTEGER';",
+                (table_name,),
+            ).fetchone()
+            primary_key = row[0] if row else None
+        try:
+            insert_csv_rows(conn, csv_file, table_name, inferred_schema, primary_key)
+        except sqlite3.IntegrityError:
+            if not (created and primary_key):
+                raise
+            # The sampled ids were unique and present but a later row repeats
+            # or omits one; rebuild the table with a plain rowid and load again
+            conn.rollback()
+            create_table(conn, table_name, inferred_schema, replace=True)
+            insert_csv_rows(conn, csv_file, table_name, inferred_schema)
         print(f"Loaded {csv_file} into table '{table_name}'")
 
     except Exception as e:
+        conn.rollback()
         print(f"Error loading CSV: {e}")
         log_error(f"[load_csv_to_table] {e}")
 
+def _write_row_batches(out, batch, cursor):
+    """Write rows batch by batch until the cursor is exhausted or the reader
+    goes away; return the number of rows written."""
+    count = 0
+    try:
+        while batch:
+            out.writelines(f"{row}\n" for row in batch)
+            count += len(batch)
+            batch = cursor.fetchmany()
+    except BrokenPipeError:
+        pass
+    return count
+
+def print_rows(cursor):
+    """Stream result rows from a cursor, paging them if they overflow the terminal.
+
+    Returns the number of rows printed.
+    """
+    cursor.arraysize = FETCH_BATCH_SIZE
+    batch = cursor.fetchmany()
+    pager_cmd = os.environ.get("PAGER", "").strip() or ("more" if sys.platform == "win32" else "less")
+    if (
+        not sys.stdout.isatty()
+        or len(batch) < min(shutil.get_terminal_size().lines, FETCH_BATCH_SIZE)
+        or not shutil.which(pager_cmd.split()[0])
+    ):
+        return _write_row_batches(sys.stdout, batch, cursor)
+
+    # Feed the pager as rows arrive; quitting it early stops fetching
+    pager = subprocess.Popen(pager_cmd, shell=True, stdin=subprocess.PIPE, text=True)
+    try:
+        count = _write_row_batches(pager.stdin, batch, cursor)
+    finally:
+        # Flushing on close fails too if the pager already exited
+        with contextlib.suppress(BrokenPipeError):
+            pager.stdin.close()
+        pager.wait()
+    return count
+
 def interactive_sql_shell(conn):
     """Interactive SQL shell for executing queries."""
+    # Repeated queries are served from sqlite3's per-connection statement
+    # cache, which is keyed by the exact SQL text, so they skip re-preparing
+    if readline:
+        readline.clear_history()  # Keep CLI menu input out of the SQL history
+        # A missing, unreadable or corrupt history file just means no history
+        with contextlib.suppress(OSError):
+            readline.read_history_file(HISTORY_FILE)
+
     while True:
         query = input("sqlite> ").strip()
         if query.lower() in {"exit", "quit"}:
@@ -93,50 +428,142 @@ def interactive_sql_shell(conn):
             break
         try:
             cursor = conn.execute(query)
-            rows = cursor.fetchall()
-            if rows:
-                for row in rows:
-                    print(row)
+            print_rows(cursor)
         except Exception as e:
             print(f"SQL Error: {e}")
 
+    if readline:
+        readline.set_history_length(HISTORY_LENGTH)
+        with contextlib.suppress(OSError):
+            readline.write_history_file(HISTORY_FILE)
+        readline.clear_history()
+
 def log_error(message):
-    with open("error_log.txt", "a") as f:
-        f.write(message + "\n")
+    global _log_file
+    # Opened on the first error and kept open, line-buffered, until exit
+    if _log_file is None:
+        _log_file = open("error_log.txt", "a", buffering=1)
+        atexit.register(_log_file.close)
+    _log_file.write(message + "\n")
         
 def get_all_tables_and_schema(conn):
+    global _schema_cache
+    # SQLite bumps schema_version on every DDL statement, so one PRAGMA tells
+    # whether the cached text is still current, whoever changed the tables
+    schema_version = conn.execute("PRAGMA schema_version").fetchone()[0]
+    if _schema_cache is not None and _schema_cache[0] == schema_version:
+        return _schema_cache[1]
+
     schema = ""
-    cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table';")
-    tables = [row[0] for row in cursor.fetchall()]
-    for table in tables:
+    # Every table's columns in one query rather than a PRAGMA per table
+    cursor = conn.execute(
+        "SELECT m.name, p.name, p.type FROM sqlite_master m "
+        "JOIN pragma_table_info(m.name) p WHERE m.type='table' ORDER BY m.name, p.cid;"
+    )
+    for table, columns in itertools.groupby(cursor, key=lambda row: row[0]):
         schema += f"\nTable: {table}\n"
         schema += f"Columns:\n"
-        for col, dtype in get_table_schema(conn, table):
+        for _, col, dtype in columns:
             schema += f"  - {col} ({dtype})\n"
+    _schema_cache = (schema_version, schema)
     return schema
         
-def ask_ai_for_sql(user_request, table_schema):
+def _strip_code_fence(text):
+    """Remove a surrounding ``` fence the model may wrap its answer in."""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.partition("\n")[2].rpartition("```")[0]
+    return text.strip()
+
+def _is_transient_openai_error(error):
+    import openai
+    return isinstance(error, (
+        openai.RateLimitError,
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.InternalServerError,
+    ))
+
+@retry(
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(3),
+    retry=retry_if_exception(_is_transient_openai_error),
+    reraise=True,
+)
+async def _call_openai(prompt, max_tokens):
+    """Send a prompt to OpenAI and return the reply text, retrying transient errors with backoff."""
+    response = await _client.chat.completions.create(
+        model=OPENAI_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0,
+        max_tokens=max_tokens,
+    )
+    return (response.choices[0].message.content or "").strip()
+
+async def _generate_sql_batch(user_requests, table_schema):
+    # One prompt for the whole batch so the schema tokens are only sent once
     prompt = f"""
 You are an expert SQL assistant. The database uses SQLite. Given the following SQLite table schema:
 
 {table_schema}
 
-Generate an SQL query that fulfills this user request:
-\"\"\"{user_request}\"\"\" 
+Generate an SQL query for each of these user requests:
+{json.dumps(user_requests, indent=2)}
 
-Only return the SQL query.
+Return a JSON array with one SQL string per request, in the same order. Only return the JSON array.
 """
 
-    try:
-        response = client.responses.create(  # Use openai.Completion.create for text generation
-            model="gpt-3.5-turbo",
-            input=prompt,
+    response = await _call_openai(prompt, MAX_TOKENS_PER_QUERY * len(user_requests))
+
+    sql_queries = json.loads(_strip_code_fence(response))
+    if (
+        not isinstance(sql_queries, list)
+        or len(sql_queries) != len(user_requests)
+        or not all(isinstance(sql_query, str) for sql_query in sql_queries)
+    ):
+        raise ValueError(f"Expected a JSON array of {len(user_requests)} SQL query strings")
+    return sql_queries
+
+def ask_ai_for_sql(user_requests, table_schema):
+    """Generate one SQL query per request; failed requests yield None."""
+    schema_digest = hashlib.blake2b(table_schema.encode(), digest_size=16).digest()
+
+    # Identical questions against an unchanged schema reuse the earlier answer
+    sql_by_request = {}
+    pending = []
+    for request in dict.fromkeys(user_requests):
+        cache_key = (request, schema_digest)
+        if cache_key in _sql_cache:
+            _sql_cache.move_to_end(cache_key)
+            sql_by_request[request] = _sql_cache[cache_key]
+        else:
+            pending.append(request)
+
+    if pending and get_openai_client() is None:
+        pending = []
+
+    batches = [pending[i:i + MAX_BATCH_QUESTIONS] for i in range(0, len(pending), MAX_BATCH_QUESTIONS)]
+
+    async def generate_all():
+        return await asyncio.gather(
+            *(_generate_sql_batch(batch, table_schema) for batch in batches),
+            return_exceptions=True,
         )
-        return response
-    except Exception as e:
-        log_error(f"[ask_ai_for_sql] {e}")
-        print(f"OpenAI Error: {e}")
-        return None
+
+    results = _loop.run_until_complete(generate_all()) if batches else []
+    for batch, result in zip(batches, results):
+        if isinstance(result, Exception):
+            log_error(f"[ask_ai_for_sql] {result}")
+            print(f"OpenAI Error: {result}")
+            continue
+        for request, sql_query in zip(batch, result):
+            sql_by_request[request] = sql_query
+            # Only successful responses are cached so failed requests can be retried
+            _sql_cache[(request, schema_digest)] = sql_query
+            if len(_sql_cache) > SQL_CACHE_SIZE:
+                _sql_cache.popitem(last=False)
+
+    return [sql_by_request.get(request) for request in user_requests]
 
 
 def main():
@@ -160,21 +587,20 @@ def main():
             interactive_sql_shell(conn)
             
         elif cmd == "chat":
-            user_request = input("Ask something about your data: ").strip()
+            user_input = input("Ask something about your data (separate questions with ';'): ")
+            user_requests = [request.strip() for request in user_input.split(";") if request.strip()]
             schema = get_all_tables_and_schema(conn)
-            sql_query = ask_ai_for_sql(user_request, schema)
-            
-            if sql_query:
+            sql_queries = ask_ai_for_sql(user_requests, schema)
+
+            for sql_query in sql_queries:
+                if not sql_query:
+                    continue
                 print(f"\nGenerated SQL:\n{sql_query}\n")
                 confirm = input("Run this query? [y/N]: ").strip().lower()
                 if confirm == "y":
                     try:
                         cursor = conn.execute(sql_query)
-                        rows = cursor.fetchall()
-                        if rows:
-                            for row in rows:
-                                print(row)
-                        else:
+                        if not print_rows(cursor):
                             print("Query executed. No rows returned.")
                     except Exception as e:
                         print(f"SQL Execution Error: {e}")
@@ -184,6 +610,7 @@ def main():
         elif cmd == "exit":
             print("Exiting.")
             conn.close()
+            close_openai_client()
             break
 
         else:
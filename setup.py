@@ -6,8 +6,11 @@ setup(
     packages=find_packages(),
     install_requires=[  # List of external dependencies
         "openai>=1.0.0",
-        "pandas>=1.0.0",
+        "tenacity>=8.0.0",
     ],
+    extras_require={  # Optional multithreaded CSV parsing for large loads
+        "arrow": ["pyarrow>=7.0.0"],
+    },
     entry_points={
         'console_scripts': [
             'gpt-sql-assistant = gpt_sql_assistant.main:main',